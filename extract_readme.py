@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
-# requires-python = ">=3.8"
-# dependencies = ["huggingface_hub", "requests"]
+# requires-python = ">=3.9"
+# dependencies = ["huggingface_hub>=1.0", "httpx[http2]", "aiolimiter", "diskcache"]
 # ///
 """
 extract_readme.py
@@ -11,7 +11,9 @@ https://huggingface.co.
 
 Usage::
 
-    python extract_readme.py <model_id> [<llm_model_id>] [--open-pr]
+    python extract_readme.py <model_id> [<llm_model_id>] [--open-pr] [--no-summary]
+
+``--no-summary`` skips fetching r.jina.ai summaries of the external URLs.
 
 Example::
 
@@ -22,20 +24,180 @@ This will download the model card and print two sections:
 2. The human-readable markdown body of the card.
 
 Requires:
-    pip install huggingface_hub
+    pip install "huggingface_hub>=1.0" "httpx[http2]" aiolimiter diskcache
 """
 import sys
 from huggingface_hub import ModelCard
 import re
 from urllib.parse import urlparse
+from pathlib import Path
 import os
-
-from huggingface_hub import InferenceClient  # type: ignore
+import asyncio
+import io
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import diskcache
+import httpx
+from aiolimiter import AsyncLimiter
+from huggingface_hub import AsyncInferenceClient, HfApi, hf_hub_download  # type: ignore
+
+_URL_RE = re.compile(r"https?://[^\s\)\]\>\'\"`]+")
+
+# Fenced code blocks (an unclosed fence runs to the end of the card) and inline
+# code spans; URLs inside them are install commands or examples, not references.
+_CODE_RE = re.compile(
+    r"^ {0,3}(`{3,}|~{3,})[^\n]*\n(?:.*?^ {0,3}\1[ \t]*$|.*\Z)|`[^`\n]+`",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Hosts (and their subdomains) whose pages are not summarised via r.jina.ai.
+_EXCLUDED_HOSTS = frozenset(
+    {
+        "colab.research.google.com",
+        "github.com",
+        "arxiv.org",
+        "ar5iv.org",
+    }
+)
+# Dotted suffixes so `str.endswith` (a single C-level call on a tuple) only
+# matches real subdomains, e.g. gist.github.com but not notgithub.com.
+_EXCLUDED_SUFFIXES = tuple("." + h for h in _EXCLUDED_HOSTS)
+
+# Caps on text forwarded to the LLM: a typical card is ~2 KB, so only outliers
+# are cut, and the first few KB of each external page carry most of its content.
+_MAX_CARD_CHARS = 30_000
+_MAX_SUMMARY_CHARS = 3_000
+
+_FETCH_RETRIES = 3
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+_JINA_CACHE = diskcache.Cache(".jina_cache")
+_JINA_CACHE_TTL = 7 * 24 * 3600
+
+# The free r.jina.ai endpoint allows ~15 requests/min; a token bucket replaces
+# fixed sleeps. It is shared by every fetch made on the running event loop.
+_JINA_LIMITER = AsyncLimiter(15, 60)
+
+# Prefix the LLM is asked to put before the discussion title (with --open-pr).
+_TITLE_MARKER = "Title:"
+
+# Shared Hub client; the token is passed per call.
+_HF_API = HfApi()
+
+
+def _load_card(model_id: str) -> ModelCard:
+    """Load the model card of *model_id* through the Hugging Face hub cache.
+
+    `hf_hub_download` revalidates the cached README against the Hub's etag and
+    only downloads it when it changed. When the Hub is unreachable it serves the
+    cached copy itself, raising `LocalEntryNotFoundError` if there is none.
+    """
+    path = hf_hub_download(model_id, "README.md")
+    return ModelCard(Path(path).read_text(encoding="utf-8"))
+
+
+def _is_excluded(url: str) -> bool:
+    """Return whether *url* points at an excluded host or one of its subdomains."""
+    host = urlparse(url).hostname or ""
+    return host in _EXCLUDED_HOSTS or host.endswith(_EXCLUDED_SUFFIXES)
+
+
+def _iter_urls(text: str) -> Iterator[str]:
+    """Yield the URLs of *text* outside markdown code blocks and code spans.
+
+    Each gap between code regions is scanned in place via ``pos``/``endpos``, so
+    no stripped copy of the whole (possibly huge) card is built.
+    """
+    pos = 0
+    for code in _CODE_RE.finditer(text):
+        for match in _URL_RE.finditer(text, pos, code.start()):
+            yield match.group(0)
+        pos = code.end()
+    for match in _URL_RE.finditer(text, pos):
+        yield match.group(0)
+
+
+def _extract_urls(text: str) -> List[str]:
+    """Return a list of unique URLs found inside *text* preserving order."""
+    seen: set[str] = set()
+    unique_urls: List[str] = []
+    for u in _iter_urls(text):
+        if u not in seen:
+            seen.add(u)
+            unique_urls.append(u)
+    return unique_urls
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    url: str,
+    sem: asyncio.BoundedSemaphore,
+    limiter: AsyncLimiter,
+) -> Tuple[str, str]:
+    """Fetch the r.jina.ai rendering of *url* and return ``(url, text)``.
+
+    Transient failures (429/5xx responses, timeouts and connection errors) are
+    retried with exponential backoff.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with sem, limiter:
+                resp = await client.get(f"https://r.jina.ai/{url}")
+        except httpx.TransportError:
+            if attempt == _FETCH_RETRIES:
+                raise
+        else:
+            if resp.status_code not in _RETRY_STATUSES or attempt == _FETCH_RETRIES:
+                resp.raise_for_status()
+                return url, resp.text
+        # Back off outside the semaphore so other fetches can proceed.
+        await asyncio.sleep(2**attempt)
+        attempt += 1
+
+
+async def _fetch_all(urls: Sequence[str]) -> List[Any]:
+    """Fetch all *urls* concurrently, returning results or exceptions in order."""
+    sem = asyncio.BoundedSemaphore(8)
+    # HTTP/2 lets concurrent requests share a single multiplexed connection.
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=15,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=8),
+    ) as client:
+        return await asyncio.gather(
+            *[_fetch(client, u, sem, _JINA_LIMITER) for u in urls], return_exceptions=True
+        )
 
 
-def main() -> None:  # pragma: no cover
+async def _summarise_external_urls_async(
+    urls: Sequence[str],
+) -> Tuple[Dict[str, str], Dict[str, BaseException]]:
+    """Summarise *urls* via r.jina.ai, returning ``(summaries, errors)`` by URL.
+
+    Previously fetched pages are served from the disk cache; only misses hit
+    r.jina.ai. Summaries keep the order of *urls*.
+    """
+    summaries = {u: _JINA_CACHE.get(u) for u in urls}
+    missing = [u for u, summary in summaries.items() if summary is None]
+    errors: Dict[str, BaseException] = {}
+    if missing:
+        for original_url, result in zip(missing, await _fetch_all(missing)):
+            if isinstance(result, BaseException):
+                errors[original_url] = result
+                del summaries[original_url]
+                continue
+            # Remove URLs from the extracted text to keep output concise.
+            cleaned_text = _URL_RE.sub("", result[1])[:_MAX_SUMMARY_CHARS]
+            _JINA_CACHE.set(original_url, cleaned_text, expire=_JINA_CACHE_TTL)
+            summaries[original_url] = cleaned_text
+    return summaries, errors
+
+
+async def _main_async() -> None:  # pragma: no cover
     if len(sys.argv) < 2:
-        print("Usage: python extract_readme.py <model_id> [<llm_model_id>] [--open-pr]")
+        print("Usage: python extract_readme.py <model_id> [<llm_model_id>] [--open-pr] [--no-summary]")
         sys.exit(1)
 
     model_id = sys.argv[1]
@@ -43,136 +205,142 @@ def main() -> None:  # pragma: no cover
     # Defaults
     llm_model_id = "CohereLabs/c4ai-command-a-03-2025"
     open_pr = False
+    fetch_summaries = True
 
     # Parse optional arguments (order-agnostic)
     for arg in sys.argv[2:]:
         if arg == "--open-pr":
             open_pr = True
+        elif arg == "--no-summary":
+            fetch_summaries = False
         else:
             llm_model_id = arg
 
+    # The collected information is only used for the LLM summary, so check for
+    # a token before spending time on the Hub and r.jina.ai fetches.
     try:
-        # Load the model card directly from the Hub.
-        card = ModelCard.load(model_id)
+        hf_token = os.environ["HF_TOKEN"]
+    except KeyError:
+        sys.stderr.write("⚠️  HF_TOKEN environment variable not set. Skipping summarization.\n")
+        return
+
+    try:
+        # Load the model card, reusing the hub cache when it is up to date.
+        card = await asyncio.to_thread(_load_card, model_id)
     except Exception as err:  # pylint: disable=broad-except
         print(f"❌ Failed to load model card for '{model_id}': {err}")
         sys.exit(1)
 
-    # Prepare container for combined output (README first).
-    combined_sections: list[str] = ["=== README markdown ===", card.text]
+    # Read the markdown body once; `ModelCard.text` is a property.
+    text = card.text
 
-    # Extract and display all URLs found in the markdown body.
-    url_pattern = re.compile(r"https?://[^\s\)\]\>\'\"`]+")
-    urls = url_pattern.findall(card.text)
+    # Prepare buffer for combined output (README first).
+    combined = io.StringIO()
+    print("=== README markdown ===", text[:_MAX_CARD_CHARS], sep="\n", file=combined)
 
-    if urls:
-        # Preserve order while removing duplicates.
-        unique_urls = list(dict.fromkeys(urls))
+    # Extract and display all URLs found in the markdown body.
+    unique_urls = _extract_urls(text)
 
+    if unique_urls:
         # Record URLs section for the final output.
-        combined_sections.append("\n=== URLs found ===")
-        combined_sections.extend(unique_urls)
+        print("\n=== URLs found ===", file=combined)
+        print(*unique_urls, sep="\n", file=combined)
 
         # Filter out arxiv, colab, and GitHub links.
-        EXCLUDED_KEYWORDS = (
-            "colab.research.google.com",
-            "github.com",
-        )
-
-        filtered_urls = [
-            u for u in unique_urls if not any(k in urlparse(u).netloc for k in EXCLUDED_KEYWORDS)
-        ]
-
-        if filtered_urls:
-            import time
-            import requests
-
-            combined_sections.append("\n=== Summaries via r.jina.ai ===")
-
-            # NOTE: The free r.jina.ai endpoint allows ~15 requests/min (4s/request).
-
-            for idx, original_url in enumerate(filtered_urls):
-                proxy_url = f"https://r.jina.ai/{original_url}"
-                try:
-                    resp = requests.get(proxy_url, timeout=15)
-                    resp.raise_for_status()
-                    # Remove URLs from the extracted text to keep output concise.
-                    cleaned_text = url_pattern.sub("", resp.text)
-                    combined_sections.append(f"\n--- {original_url} ---\n{cleaned_text}")
-                except Exception as err:  # pylint: disable=broad-except
-                    sys.stderr.write(f"❌ Failed to fetch '{original_url}': {err}\n")
-
-                # Respect rate limit: sleep ~4 seconds between calls (<=15/minute)
-                if idx < len(filtered_urls) - 1:
-                    time.sleep(4.1)
+        filtered_urls = [u for u in unique_urls if not _is_excluded(u)]
+
+        if filtered_urls and fetch_summaries:
+            print("\n=== Summaries via r.jina.ai ===", file=combined)
+
+            summaries, errors = await _summarise_external_urls_async(filtered_urls)
+            for original_url, err in errors.items():
+                sys.stderr.write(f"❌ Failed to fetch '{original_url}': {err}\n")
+            for original_url, cleaned_text in summaries.items():
+                print(f"\n--- {original_url} ---\n{cleaned_text}", file=combined)
+        elif filtered_urls:
+            print("\nSummaries of external URLs skipped (--no-summary).", file=combined)
         else:
-            combined_sections.append("\nNo external URLs (after filtering) detected in the model card.")
+            print("\nNo external URLs (after filtering) detected in the model card.", file=combined)
     else:
-        combined_sections.append("\nNo URLs detected in the model card.")
+        print("\nNo URLs detected in the model card.", file=combined)
 
     # Print the final aggregated output.
-    combined_output = "\n".join(combined_sections)
+    combined_output = combined.getvalue()
+
+    # When opening a discussion, ask for the title in the same completion
+    # rather than issuing a second LLM call.
+    title_instruction = (
+        f"Start your answer with a first line of the form '{_TITLE_MARKER} <title>', where <title> "
+        "is a concise, engaging title (under 10 words) for a Hugging Face discussion summarising "
+        "the model, without quotes, then write the summary below it. "
+        if open_pr
+        else ""
+    )
+
+    prompt = f"You are given a lot of information about a machine learning model available on Hugging Face. \
+    Create a concise, technical and to the point summary highlighting the technical details, comparisons and instuctions to run the model (if available). \
+    Think of the summary as a gist with all the information someone shoudl need to know about the model without overwhelming them. \
+    Do not add any text formatting to your output text, keep it simple and plain text. If you have to then sparingly just use markdown for Heading and lists. \
+    Specifically do not use ** to bold text, just use # for headings and - for lists. \
+    No need to put any contact information in the summary. The summary is supposed to be insightful and information dense and should not be more than 200-300 words. \
+    Don't hallucinate and refer only to the content provided to you. Remember to be concise. {title_instruction}Here is the information:\n\n{combined_output}"
 
-    # Summarize the collected information using Cohere's LLM via Hugging Face Inference Client.
     try:
-        hf_token = os.environ["HF_TOKEN"]
-    except KeyError:
-        sys.stderr.write("⚠️  HF_TOKEN environment variable not set. Skipping summarization.\n")
-    else:
-        client = InferenceClient(provider="auto", api_key=hf_token)
-
-        prompt = f"You are given a lot of information about a machine learning model available on Hugging Face. \
-        Create a concise, technical and to the point summary highlighting the technical details, comparisons and instuctions to run the model (if available). \
-        Think of the summary as a gist with all the information someone shoudl need to know about the model without overwhelming them. \
-        Do not add any text formatting to your output text, keep it simple and plain text. If you have to then sparingly just use markdown for Heading and lists. \
-        Specifically do not use ** to bold text, just use # for headings and - for lists. \
-        No need to put any contact information in the summary. The summary is supposed to be insightful and information dense and should not be more than 200-300 words. \
-        Don't hallucinate and refer only to the content provided to you. Remember to be concise. Here is the information:\n\n{combined_output}"
-
-        try:
-            completion = client.chat.completions.create(
+        # Summarize the collected information using Cohere's LLM via Hugging Face
+        # Inference Client, closing its connection pool once the call is done.
+        async with AsyncInferenceClient(provider="auto", api_key=hf_token) as client:
+            completion = await client.chat.completions.create(
                 model=llm_model_id,
                 messages=[{"role": "user", "content": prompt}],
             )
-            summary_text = completion.choices[0].message.content
-
-            print("\n=== SUMMARY ===")
-            print(summary_text)
-
-            # Optionally open a discussion on the model repo with the summary.
-            if open_pr:
-                # Ask the same LLM to craft a short (<10 words) title.
-                title_prompt = (
-                    "Provide a concise, engaging title (under 10 words) "
-                    "for a Hugging Face discussion summarising the model below. "
-                    "Return only the title without quotes or extra text.\n\n" + summary_text
+        summary_text = completion.choices[0].message.content
+
+        discussion_title = "Model Summary"
+        if open_pr:
+            # Only trust the first line as a title when it carries the marker,
+            # otherwise e.g. a leading "# Overview" heading would be taken.
+            # `content` may be None (e.g. a refusal), which falls back as well.
+            title_line, _, rest = (summary_text or "").strip().partition("\n")
+            title = ""
+            if title_line.lower().startswith(_TITLE_MARKER.lower()):
+                title = title_line[len(_TITLE_MARKER):].strip().strip("\"'")
+            if title and rest.strip():
+                discussion_title, summary_text = title, rest.strip()
+            else:
+                sys.stderr.write("⚠️  Failed to parse title from LLM output. Using fallback.\n")
+
+        print("\n=== SUMMARY ===")
+        print(summary_text)
+
+        # Optionally open a discussion on the model repo with the summary.
+        if open_pr:
+            try:
+                await asyncio.to_thread(
+                    _HF_API.create_discussion,
+                    repo_id=model_id,
+                    title=discussion_title,
+                    description=summary_text,
+                    token=hf_token,
                 )
+                print(f"✅ Discussion opened on the Hub: '{discussion_title}'")
+            except Exception as err:  # pylint: disable=broad-except
+                sys.stderr.write(f"❌ Failed to open discussion: {err}\n")
+
+    except Exception as err:  # pylint: disable=broad-except
+        sys.stderr.write(f"❌ Failed to generate summary: {err}\n")
 
-                try:
-                    title_completion = client.chat.completions.create(
-                        model=llm_model_id,
-                        messages=[{"role": "user", "content": title_prompt}],
-                    )
-                    discussion_title = title_completion.choices[0].message.content.strip()
-                except Exception as err:  # pylint: disable=broad-except
-                    sys.stderr.write(f"⚠️  Failed to generate title with LLM: {err}. Using fallback.\n")
-                    discussion_title = "Model Summary"
-
-                from huggingface_hub import HfApi
-
-                api = HfApi(token=hf_token)
-                try:
-                    api.create_discussion(
-                        repo_id=model_id,
-                        title=discussion_title,
-                        description=summary_text,
-                    )
-                    print(f"✅ Discussion opened on the Hub: '{discussion_title}'")
-                except Exception as err:  # pylint: disable=broad-except
-                    sys.stderr.write(f"❌ Failed to open discussion: {err}\n")
-
-        except Exception as err:  # pylint: disable=broad-except
-            sys.stderr.write(f"❌ Failed to generate summary: {err}\n")
+
+def main() -> None:  # pragma: no cover
+    # uvloop is a faster drop-in event loop; fall back to asyncio where it is
+    # unavailable (e.g. Windows) or too old to provide `uvloop.run` (< 0.18).
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        uvloop = None
+    if hasattr(uvloop, "run"):
+        uvloop.run(_main_async())
+    else:
+        asyncio.run(_main_async())
 
 
 if __name__ == "__main__":
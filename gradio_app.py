@@ -12,61 +12,40 @@ Run locally:
 
 This will start both the Gradio web server *and* the MCP endpoint.  The latter
 is announced in the terminal when the app starts.
+
+Requires the dependencies of `extract_readme.py` plus Gradio::
+
+    pip install gradio "huggingface_hub>=1.0" "httpx[http2]" aiolimiter diskcache
+
+`huggingface_hub>=1.0` is needed for an httpx-based `AsyncInferenceClient`
+(older releases require aiohttp).
 """
 
 from __future__ import annotations
 
+import asyncio
+import io
 import os
-import re
-import time
 from types import TracebackType
 from typing import Any, List, Sequence, Tuple, Type
-from urllib.parse import urlparse
 
 import gradio as gr
-import requests
-from huggingface_hub import HfApi, InferenceClient, ModelCard  # type: ignore
+from huggingface_hub import AsyncInferenceClient  # type: ignore
+
+from extract_readme import (
+    _MAX_CARD_CHARS,
+    _extract_urls,
+    _is_excluded,
+    _load_card,
+    _summarise_external_urls_async,
+)
 
 # -----------------------------------------------------------------------------
-# Core logic (adapted from extract_readme.py)
+# Core logic (shared helpers live in extract_readme.py)
 # -----------------------------------------------------------------------------
 
-
-def _extract_urls(text: str) -> List[str]:
-    """Return a list of unique URLs found inside *text* preserving order."""
-    url_pattern = re.compile(r"https?://[^\s\)\]\>'\"`]+")
-    urls = url_pattern.findall(text)
-    # Preserve insertion order while removing duplicates.
-    seen: set[str] = set()
-    unique_urls: List[str] = []
-    for u in urls:
-        if u not in seen:
-            unique_urls.append(u)
-            seen.add(u)
-    return unique_urls
-
-
-def _summarise_external_urls(urls: Sequence[str]) -> List[Tuple[str, str]]:
-    """Return a list of (url, summary) tuples using the r.jina.ai proxy."""
-    if not urls:
-        return []
-
-    summaries: List[Tuple[str, str]] = []
-    url_pattern = re.compile(r"https?://[^\s\)\]\>'\"`]+")
-
-    for idx, original_url in enumerate(urls):
-        proxy_url = f"https://r.jina.ai/{original_url}"
-        try:
-            resp = requests.get(proxy_url, timeout=15)
-            resp.raise_for_status()
-            cleaned_text = url_pattern.sub("", resp.text)
-            summaries.append((original_url, cleaned_text))
-        except Exception as err:  # pylint: disable=broad-except
-            summaries.append((original_url, f"❌ Failed to fetch summary: {err}"))
-        # Respect ~15 req/min rate-limit of r.jina.ai
-        if idx < len(urls) - 1:
-            time.sleep(4.1)
-    return summaries
+# Maximum number of `extract_model_info` calls Gradio runs at the same time.
+_CONCURRENCY_LIMIT = 8
 
 
 # -----------------------------------------------------------------------------
@@ -74,7 +53,7 @@ def _summarise_external_urls(urls: Sequence[str]) -> List[Tuple[str, str]]:
 # -----------------------------------------------------------------------------
 
 
-def extract_model_info(
+async def extract_model_info(
     model_id: str,
     llm_model_id: str = "CohereLabs/c4ai-command-a-03-2025",
 ) -> str:
@@ -97,70 +76,79 @@ def extract_model_info(
             4. A concise LLM-generated summary of the model card.
     """
 
+    # Without a token there is nothing to return, so bail out before spending
+    # time on the Hub and r.jina.ai fetches.
+    hf_token = os.getenv("HF_TOKEN")
+    if not hf_token:
+        return "⚠️  HF_TOKEN environment variable not set. Please set it to enable summarisation."
+
     # ------------------------------------------------------------------
     # 1. Load model card
     # ------------------------------------------------------------------
     try:
-        card = ModelCard.load(model_id)
+        card = await asyncio.to_thread(_load_card, model_id)
     except Exception as err:  # pylint: disable=broad-except
         return f"❌ Failed to load model card for '{model_id}': {err}"
 
-    combined_sections: List[str] = ["=== README markdown ===", card.text]
+    # Read the markdown body once; `ModelCard.text` is a property.
+    text = card.text
+
+    combined = io.StringIO()
+    print("=== README markdown ===", text[:_MAX_CARD_CHARS], sep="\n", file=combined)
 
     # ------------------------------------------------------------------
     # 2. Extract URLs
     # ------------------------------------------------------------------
-    unique_urls = _extract_urls(card.text)
+    # Scanning multi-MB outlier cards takes a noticeable fraction of a second;
+    # keep it off the event loop so concurrent requests are not stalled.
+    unique_urls = await asyncio.to_thread(_extract_urls, text)
     if unique_urls:
-        combined_sections.append("\n=== URLs found ===")
-        combined_sections.extend(unique_urls)
+        print("\n=== URLs found ===", file=combined)
+        print(*unique_urls, sep="\n", file=combined)
 
-        EXCLUDED_KEYWORDS = ("colab.research.google.com", "github.com")
-        filtered_urls = [
-            u for u in unique_urls if not any(k in urlparse(u).netloc for k in EXCLUDED_KEYWORDS)
-        ]
+        filtered_urls = [u for u in unique_urls if not _is_excluded(u)]
 
         if filtered_urls:
-            combined_sections.append("\n=== Summaries via r.jina.ai ===")
-            for url, summary in _summarise_external_urls(filtered_urls):
-                combined_sections.append(f"\n--- {url} ---\n{summary}")
+            print("\n=== Summaries via r.jina.ai ===", file=combined)
+            summaries, errors = await _summarise_external_urls_async(filtered_urls)
+            for url in filtered_urls:
+                summary = summaries[url] if url in summaries else f"❌ Failed to fetch summary: {errors[url]}"
+                print(f"\n--- {url} ---\n{summary}", file=combined)
         else:
-            combined_sections.append("\nNo external URLs (after filtering) detected in the model card.")
+            print("\nNo external URLs (after filtering) detected in the model card.", file=combined)
     else:
-        combined_sections.append("\nNo URLs detected in the model card.")
+        print("\nNo URLs detected in the model card.", file=combined)
 
     # ------------------------------------------------------------------
-    # 3. Summarise with LLM (if token available)
+    # 3. Summarise with LLM
     # ------------------------------------------------------------------
-    hf_token = os.getenv("HF_TOKEN")
     summary_text: str | None = None
-    if hf_token:
-        client = InferenceClient(provider="auto", api_key=hf_token)
-        prompt = (
-            "You are given a lot of information about a machine learning model "
-            "available on Hugging Face. Create a concise, technical and to the point "
-            "summary highlighting the technical details, comparisons and instructions "
-            "to run the model (if available). Think of the summary as a gist with all "
-            "the information someone should need to know about the model without "
-            "overwhelming them. Do not add any text formatting to your output text, "
-            "keep it simple and plain text. If you have to then sparingly just use "
-            "markdown for Heading and lists. Specifically do not use ** to bold text, "
-            "just use # for headings and - for lists. No need to put any contact "
-            "information in the summary. The summary is supposed to be insightful and "
-            "information dense and should not be more than 200-300 words. Don't "
-            "hallucinate and refer only to the content provided to you. Remember to "
-            "be concise. Here is the information:\n\n" + "\n".join(combined_sections)
-        )
-        try:
-            completion = client.chat.completions.create(
+    prompt = (
+        "You are given a lot of information about a machine learning model "
+        "available on Hugging Face. Create a concise, technical and to the point "
+        "summary highlighting the technical details, comparisons and instructions "
+        "to run the model (if available). Think of the summary as a gist with all "
+        "the information someone should need to know about the model without "
+        "overwhelming them. Do not add any text formatting to your output text, "
+        "keep it simple and plain text. If you have to then sparingly just use "
+        "markdown for Heading and lists. Specifically do not use ** to bold text, "
+        "just use # for headings and - for lists. No need to put any contact "
+        "information in the summary. The summary is supposed to be insightful and "
+        "information dense and should not be more than 200-300 words. Don't "
+        "hallucinate and refer only to the content provided to you. Remember to "
+        "be concise. Here is the information:\n\n" + combined.getvalue()
+    )
+    try:
+        # Close the client's connection pool once the request is done; one is
+        # created per call, so leaving it open would leak connections.
+        async with AsyncInferenceClient(provider="auto", api_key=hf_token) as client:
+            completion = await client.chat.completions.create(
                 model=llm_model_id,
                 messages=[{"role": "user", "content": prompt}],
             )
-            summary_text = completion.choices[0].message.content
-        except Exception as err:  # pylint: disable=broad-except
-            return f"❌ Failed to generate summary: {err}"
-    else:
-        return "⚠️  HF_TOKEN environment variable not set. Please set it to enable summarisation."
+        summary_text = completion.choices[0].message.content
+    except Exception as err:  # pylint: disable=broad-except
+        return f"❌ Failed to generate summary: {err}"
     # Return only the summary text if available
     return summary_text or "❌ Summary generation failed for unknown reasons."
 
@@ -182,6 +170,7 @@ demo = gr.Interface(
         "summarise it with an LLM and (optionally) open a discussion on the Hub. "
         "This tool is also available via MCP so LLM clients can call it directly."
     ),
+    concurrency_limit=_CONCURRENCY_LIMIT,
 )
 
 if __name__ == "__main__":